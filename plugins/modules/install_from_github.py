@@ -5,19 +5,44 @@
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 import re
+import urllib.error
 import urllib.request
-from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import AnsibleModule, env_fallback
 import json
 import tempfile
 import shutil
 import os
-from typing import Union, List
+from typing import BinaryIO, Callable, Union, List
 import bz2
-import gzip
 import lzma
+import tarfile
+import zipfile
 import platform
-import filecmp
+import pwd
+import grp
+import stat
+import hashlib
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+try:
+    # optional, parses large release JSONs several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # optional, decompresses gzip several times faster than zlib
+    from isal.igzip import open as gzip_open
+except ImportError:
+    from gzip import open as gzip_open
+
+try:
+    # optional, needed for decompressing .zst assets
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 DOCUMENTATION = r"""
@@ -89,6 +114,13 @@ options:
     required: false
     type: path
 
+  github_token:
+    description:
+      - A Github token for authenticating requests to Github API. Authenticated requests
+        have a much higher rate limit. If not set, the `GITHUB_TOKEN` environment variable is used.
+    required: false
+    type: str
+
   move_rules:
     description:
       - You need to specify how individual items from an asset should be moved to the system.
@@ -151,19 +183,117 @@ EXAMPLES = r"""
         dst: /usr/local/share/example
 """
 
+RELEASE_CACHE_DIR = os.path.expanduser("~/.cache/ansible-github")
+
+# These don't change at runtime (and may spawn a subprocess on some platforms).
+SYSTEM = platform.system().lower()  # linux, darwin, windows, ...
+MACHINE = platform.machine().lower()
+
+# names used for the same CPU architecture in asset names
+ARCHITECTURE_ALIASES = {
+    "x86_64": ["x86_64", "amd64"],
+    "amd64": ["x86_64", "amd64"],
+    "aarch64": ["aarch64", "arm64"],
+    "arm64": ["aarch64", "arm64"],
+}
+
+# below this many paths, setting attributes in a thread pool isn't worth it
+PARALLEL_ATTRIBUTES_MIN_PATHS = 100
+
+REPO_REGEX = re.compile(r"[\w\-_]+/[\w\-_]+")
+DEFAULT_VERSION_REGEX = re.compile(r"\d+\.\d+(?:\.\d+)?")
+
+# tarball extensions and their compression, as given to tarfile's stream mode
+# (xz also reads legacy .lzma files, so they don't have to use the default preset)
+TAR_EXTENSIONS = {
+    ".tar": "*",
+    ".tar.gz": "gz",
+    ".tgz": "gz",
+    ".tar.bz2": "bz2",
+    ".tar.bz": "bz2",
+    ".tar.bzip": "bz2",
+    ".tbz2": "bz2",
+    ".tar.xz": "xz",
+    ".tar.lzma": "xz",
+    ".txz": "xz",
+}
+# only extracted if zstandard is installed
+TAR_ZST_EXTENSIONS = (".tar.zst", ".tzst")
+
+
+def get_json_url(url: str, token: str = None, cache_dir: str = RELEASE_CACHE_DIR) -> dict:
+    """
+    Get a JSON response from Github API.
+
+    Responses are cached in `cache_dir` along with their ETag and Last-Modified headers,
+    and later requests for the same url are conditional. If nothing has changed, Github
+    answers with "304 Not Modified", which has no body and does not count against the
+    rate limit.
+    """
+    cache_path = os.path.join(cache_dir, f"{hashlib.sha256(url.encode()).hexdigest()}.json")
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "quera.github.install_from_github",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    try:
+        with open(cache_path, "rb") as fp:
+            cached = json_loads(fp.read())
+    except (OSError, ValueError):
+        cached = None
+    else:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
 
-def get_json_url(url: str) -> dict:
-    return json.load(urllib.request.urlopen(url))
+    try:
+        response = urllib.request.urlopen(urllib.request.Request(url, headers=headers))
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            return cached["data"]
+        raise
+    with response:
+        data = json_loads(response.read())
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+    if etag or last_modified:
+        fp = None
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            # write a temporary file and rename it, so no run ever reads a partial entry
+            with tempfile.NamedTemporaryFile("w", dir=cache_dir, delete=False) as fp:
+                json.dump({"etag": etag, "last_modified": last_modified, "data": data}, fp)
+            os.replace(fp.name, cache_path)
+        except OSError:
+            # caching is best-effort (e.g. cache_dir may not be writable)
+            if fp is not None:
+                try:
+                    os.unlink(fp.name)
+                except OSError:
+                    pass
+    return data
 
 
 def files_have_same_content(path1: str, path2: str):
-    if not os.path.isfile(path1) or not os.path.isfile(path2):
+    stat1, stat2 = os.stat(path1), os.stat(path2)
+    if not stat.S_ISREG(stat1.st_mode) or not stat.S_ISREG(stat2.st_mode):
         raise Exception
-    return filecmp.cmp(path1, path2)
-
-
-def extract_version(s: str, version_regex: str) -> Union[str, None]:
-    m = re.search(version_regex, s)
+    if stat1.st_size != stat2.st_size:
+        return False
+    with open(path1, "rb") as fp1, open(path2, "rb") as fp2:
+        while True:
+            chunk1, chunk2 = fp1.read(1024 * 1024), fp2.read(1024 * 1024)
+            if chunk1 != chunk2:
+                return False
+            if not chunk1:
+                return True
+
+
+def extract_version(s: str, version_regex: re.Pattern) -> Union[str, None]:
+    m = version_regex.search(s)
     if m:
         return m.group(0)
 
@@ -171,7 +301,7 @@ def extract_version(s: str, version_regex: str) -> Union[str, None]:
 def is_download_required(
     module: AnsibleModule,
     version_command: str,
-    version_regex: str,
+    version_regex: re.Pattern,
     version_file: str,
     release_info: dict,
 ):
@@ -203,117 +333,340 @@ def is_download_required(
         return version_installed != version_to_install
 
 
-def decompress_file(path: str):
-    path0, ext = os.path.splitext(path)
+class CountingReader:
+    """Wrap a file object and count the bytes read from it."""
+
+    def __init__(self, fileobj: BinaryIO):
+        self.fileobj = fileobj
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size) if size >= 0 else self.fileobj.read()
+        self.bytes_read += len(data)
+        return data
+
+
+def decompress_file(fileobj: BinaryIO, file_name: str, dest_dir: str):
+    """
+    Write the content of `fileobj` into `dest_dir`, decompressing it on the fly
+    if `file_name` has a compression extension.
+    """
+    path0, ext = os.path.splitext(file_name)
     if ext in [".bz2", ".bz", ".bzip"]:
-        CompressedFile = bz2.BZ2File
+        open_compressed = bz2.open
     elif ext in [".xz", ".lzma"]:
-        CompressedFile = lzma.LZMAFile
+        open_compressed = lzma.open
     elif ext in [".gz"]:
-        CompressedFile = gzip.GzipFile
+        open_compressed = gzip_open
+    elif ext in [".zst"] and zstandard is not None:
+        # by default, stream_reader stops at the end of the first frame
+        open_compressed = partial(zstandard.ZstdDecompressor().stream_reader, read_across_frames=True)
     else:
-        return path
-    with CompressedFile(path) as fr, open(path0, "wb") as fw:
-        shutil.copyfileobj(fr, fw)
-    return path0
+        open_compressed = None
+        path0 = file_name
+    with open(os.path.join(dest_dir, path0), "wb") as fw:
+        if open_compressed is None:
+            shutil.copyfileobj(fileobj, fw, length=1024 * 1024)
+        else:
+            with open_compressed(fileobj) as fr:
+                shutil.copyfileobj(fr, fw, length=1024 * 1024)
 
 
-def move_paths(module: AnsibleModule, paths_to_move: dict, validate_only=False) -> bool:
-    if not validate_only:
-        # We need this to be atomic (move all or nothing).
-        # So we validate first, and then move files.
-        move_paths(module, paths_to_move, validate_only=True)
-    changed = False
-    for dest, path_list in paths_to_move.items():
-        if os.path.isdir(dest):
-            for p in path_list:
-                dst_path = os.path.join(dest, os.path.basename(p))
-                if os.path.isdir(p) and os.path.exists(dst_path):
-                    module.fail_json(
-                        msg=f"Destination path '{dst_path}' already exists."
-                    )
-            if not validate_only:
-                for abs_path in path_list:
-                    shutil.move(
-                        abs_path, os.path.join(dest, os.path.basename(abs_path))
-                    )
-                changed = True
+def extract_tar_stream(fileobj: BinaryIO, mode: str, extract_dir: str):
+    # read in 1 MiB blocks instead of tarfile's default 10 KiB records
+    with tarfile.open(fileobj=fileobj, mode=mode, bufsize=1024 * 1024) as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(extract_dir, filter="data")
         else:
-            if len(path_list) > 1:
-                module.fail_json(msg=f"Can't move multiple files/dirs to '{dest}'.")
-            abs_path = path_list[0]
-            if not os.path.exists(dest):
-                if not os.path.exists(os.path.dirname(dest)):
-                    module.fail_json(
-                        msg=f"Directory '{os.path.dirname(dest)}' does not exist."
-                    )
-                if not validate_only:
-                    shutil.move(abs_path, dest)
-                    changed = True
-            else:
-                if os.path.isdir(abs_path):
-                    module.fail_json(msg=f"File '{dest}' exists.")
-                if not validate_only:
-                    if not files_have_same_content(abs_path, dest):
-                        changed = True
-                    shutil.move(abs_path, dest)
+            tar.extractall(extract_dir)
+
+
+def extract_asset(fileobj: BinaryIO, file_name: str, temp_dir: str, extract_dir: str):
+    """
+    Extract the asset read from `fileobj` into `extract_dir` if it is an archive.
+    Otherwise (after decompressing it if needed) just write it into `extract_dir`.
+    """
+    name = file_name.lower()
+    tar_compression = next((c for ext, c in TAR_EXTENSIONS.items() if name.endswith(ext)), None)
+    if tar_compression is not None:
+        # Extract while downloading. In stream mode ("r|...") tarfile reads (and
+        # decompresses) the archive sequentially, so it never touches the disk.
+        extract_tar_stream(fileobj, f"r|{tar_compression}", extract_dir)
+    elif name.endswith(TAR_ZST_EXTENSIONS) and zstandard is not None:
+        # tarfile can't decompress zstd itself, so feed it the decompressed stream
+        with zstandard.ZstdDecompressor().stream_reader(fileobj, read_across_frames=True) as fr:
+            extract_tar_stream(fr, "r|", extract_dir)
+    elif name.endswith(".zip"):
+        # zip needs a seekable file
+        path = os.path.join(temp_dir, file_name)
+        with open(path, "wb") as fw:
+            shutil.copyfileobj(fileobj, fw, length=1024 * 1024)
+        with zipfile.ZipFile(path) as zip_file:
+            zip_file.extractall(extract_dir)
+    else:
+        # Decompress while downloading, so the compressed file never touches the disk.
+        decompress_file(fileobj, file_name, extract_dir)
+
+
+def fast_move(src: str, dst: str):
+    # A single rename(2) when src and dst are on the same filesystem. Otherwise
+    # (or if dst is an existing directory, ...) fall back to shutil.move.
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
+def plan_moves(module: AnsibleModule, dest: str, path_list: List[str]) -> List[tuple]:
+    """
+    Validate moving `path_list` to `dest` (without touching anything) and return
+    the planned moves as (src, dst, whether dst is an existing file) tuples.
+    """
+    if os.path.isdir(dest):
+        moves = []
+        for p in path_list:
+            dst_path = os.path.join(dest, os.path.basename(p))
+            if os.path.isdir(p) and os.path.exists(dst_path):
+                module.fail_json(
+                    msg=f"Destination path '{dst_path}' already exists."
+                )
+            moves.append((p, dst_path, False))
+        return moves
+
+    if len(path_list) > 1:
+        module.fail_json(msg=f"Can't move multiple files/dirs to '{dest}'.")
+    abs_path = path_list[0]
+    if not os.path.exists(dest):
+        dest_dir = os.path.dirname(dest)
+        if not os.path.exists(dest_dir):
+            module.fail_json(msg=f"Directory '{dest_dir}' does not exist.")
+        return [(abs_path, dest, False)]
+    if os.path.isdir(abs_path):
+        module.fail_json(msg=f"File '{dest}' exists.")
+    return [(abs_path, dest, True)]
+
+
+def move_paths(module: AnsibleModule, paths_to_move: dict) -> bool:
+    # We need this to be atomic (move all or nothing).
+    # So we validate everything and plan the moves first, and then move files.
+    moves = []
+    for dest, path_list in paths_to_move.items():
+        moves.extend(plan_moves(module, dest, path_list))
+
+    changed = False
+    for src, dst, dst_exists in moves:
+        if not dst_exists or not files_have_same_content(src, dst):
+            changed = True
+        fast_move(src, dst)
     return changed
 
 
+def get_uid(owner: Union[str, int]) -> Union[int, None]:
+    try:
+        return int(owner)
+    except ValueError:
+        try:
+            return pwd.getpwnam(owner).pw_uid
+        except KeyError:
+            return None
+
+
+def get_gid(group: Union[str, int]) -> Union[int, None]:
+    try:
+        return int(group)
+    except ValueError:
+        try:
+            return grp.getgrnam(group).gr_gid
+        except KeyError:
+            return None
+
+
+def get_mode_bits(mode: Union[str, int]) -> Union[int, None]:
+    if isinstance(mode, int):
+        return mode
+    if re.fullmatch(r"[0-7]+", mode):
+        return int(mode, 8)
+    # symbolic mode (e.g. u+x) depends on the current mode
+
+
 def set_mode_owner_group(module: AnsibleModule, path: str, mode, owner, group):
-    module.set_owner_if_different(path, owner or os.getuid(), False)
-    module.set_group_if_different(path, group or os.getgid(), False)
-    if mode is not None:
-        module.set_mode_if_different(path, mode, False)
-    if os.path.isdir(path):
-        for item in os.listdir(path):
-            set_mode_owner_group(module, os.path.join(path, item), mode, owner, group)
+    # Resolve the wanted ids/mode once, so that each path is compared against a single
+    # lstat result and the module's setters (which each lstat the path again) are only
+    # called for attributes which actually differ (or can't be resolved here).
+    uid, gid = get_uid(owner), get_gid(group)
+    mode_bits = get_mode_bits(mode) if mode is not None else None
+
+    def set_attributes(p: str, st: os.stat_result):
+        # chown clears the setuid/setgid bits, so the mode must be checked again after it
+        chowned = False
+        if uid is None or st.st_uid != uid:
+            module.set_owner_if_different(p, owner, False)
+            chowned = True
+        if gid is None or st.st_gid != gid:
+            module.set_group_if_different(p, group, False)
+            chowned = True
+        if mode is not None and (
+            chowned or mode_bits is None or stat.S_IMODE(st.st_mode) != mode_bits
+        ):
+            module.set_mode_if_different(p, mode, False)
+
+    # Walk the tree iteratively. DirEntry.is_dir() uses the file type returned by
+    # readdir, so children need no extra stat. Symlinks are not followed.
+    path_stat = os.lstat(path)
+    path_stats = [(path, path_stat)]
+    dirs = [path] if stat.S_ISDIR(path_stat.st_mode) else []
+    while dirs:
+        with os.scandir(dirs.pop()) as it:
+            for entry in it:
+                path_stats.append((entry.path, entry.stat(follow_symlinks=False)))
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+
+    if (
+        len(path_stats) < PARALLEL_ATTRIBUTES_MIN_PATHS
+        or uid is None
+        or gid is None
+        or (mode is not None and mode_bits is None)
+    ):
+        for p, st in path_stats:
+            set_attributes(p, st)
+        return
 
+    # For large trees, issue the chown/chmod syscalls from a thread pool (they release
+    # the GIL). Workers must not call module.fail_json, so errors are collected and
+    # reported from here.
+    def set_attributes_raw(p: str, st: os.stat_result) -> Union[str, None]:
+        try:
+            if st.st_uid != uid or st.st_gid != gid:
+                os.lchown(p, uid, gid)
+                # chown clears the setuid/setgid bits
+                st = os.lstat(p)
+            # like set_mode_if_different, never change a symlink's target
+            if mode is not None and not stat.S_ISLNK(st.st_mode) and stat.S_IMODE(st.st_mode) != mode_bits:
+                os.chmod(p, mode_bits)
+        except OSError as e:
+            return f"Failed to set owner/group/mode of '{p}': {e}"
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        errors = [e for e in executor.map(lambda item: set_attributes_raw(*item), path_stats) if e]
+    if errors:
+        module.fail_json(msg=errors[0])
+
+
+def get_move_rule_matcher(
+    move_rules: List[dict], patterns: List[re.Pattern]
+) -> Callable[[str], Union[dict, None]]:
+    """
+    Return a function which finds the first move rule whose `src_regex` matches a path.
+    `patterns` are the compiled `src_regex` of `move_rules`, in the same order.
+    """
+
+    # If no rule has its own groups or global inline flags, join all rules into a single
+    # alternation and find the matched rule by group name. This needs one regex call per
+    # path instead of one per rule. Alternatives are tried from left to right, so the
+    # first rule still wins. (Groups in rules would conflict with each other or break
+    # backrefs. A global flag like `(?i)` would apply to every rule on Python < 3.11.)
+    if patterns and all(
+        pattern.groups == 0 and pattern.flags == re.UNICODE for pattern in patterns
+    ):
+        try:
+            combined = re.compile(
+                "|".join(f"(?P<r{i}>{pattern.pattern})" for i, pattern in enumerate(patterns))
+            )
+        except re.error:
+            pass
+        else:
 
-def download_asset(module: AnsibleModule, file_name: str, url: str, move_rules: List[dict]):
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file_path = os.path.join(temp_dir, file_name)
-        urllib.request.urlretrieve(url, file_path)
+            def match_combined(path: str) -> Union[dict, None]:
+                m = combined.fullmatch(path)
+                if m:
+                    return move_rules[int(m.lastgroup[1:])]
 
-        file_path = decompress_file(file_path)
+            return match_combined
 
+    def match_each(path: str) -> Union[dict, None]:
+        for pattern, move_rule in zip(patterns, move_rules):
+            if pattern.fullmatch(path):
+                return move_rule
+
+    return match_each
+
+
+def get_temp_parent_dir(move_rules: List[dict]) -> Union[str, None]:
+    """
+    Return a writable directory on the same filesystem as the first move rule's
+    destination, if the default temp directory is on another filesystem (e.g. /tmp
+    on tmpfs). Extracting there makes the final moves renames instead of copies.
+    """
+    if not move_rules:
+        return None
+    dst = move_rules[0]["dst"]
+    dst_dir = dst if os.path.isdir(dst) else os.path.dirname(dst)
+    try:
+        if os.stat(dst_dir).st_dev == os.stat(tempfile.gettempdir()).st_dev:
+            return None
+    except OSError:
+        return None
+    if os.access(dst_dir, os.W_OK):
+        return dst_dir
+
+
+def download_asset(
+    module: AnsibleModule,
+    file_name: str,
+    url: str,
+    move_rules: List[dict],
+    src_patterns: List[re.Pattern],
+):
+    with tempfile.TemporaryDirectory(
+        prefix=".install_from_github-", dir=get_temp_parent_dir(move_rules)
+    ) as temp_dir:
         extract_dir = os.path.join(temp_dir, "extract")
         os.mkdir(extract_dir)
 
-        try:
-            # try extracting if downloaded file is an archive
-            shutil.unpack_archive(file_path, extract_dir)
-        except shutil.ReadError:
-            shutil.move(file_path, extract_dir)
+        request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+        with urllib.request.urlopen(request) as response:
+            reader = CountingReader(response)
+            extract_asset(reader, file_name, temp_dir, extract_dir)
+            # An archive may end before the body does, so read the rest. urlopen doesn't
+            # detect a body which was cut short, so compare the size with Content-Length.
+            while reader.read(1024 * 1024):
+                pass
+            content_length = response.headers.get("Content-Length")
+        if content_length is not None and reader.bytes_read < int(content_length):
+            module.fail_json(
+                msg=f"Downloaded only {reader.bytes_read} of {content_length} bytes of '{file_name}'."
+            )
 
         paths_to_move = defaultdict(list)
         paths_to_move_rule = {}
 
+        match_move_rule = get_move_rule_matcher(move_rules, src_patterns)
+
         for root, dirs, files in os.walk(extract_dir):
+            # relpath is costly, so compute it once per directory rather than once per item
+            rel_root = os.path.relpath(root, extract_dir)
+            matched_items = set()
             for item in dirs + files:
                 abs_path = os.path.join(root, item)
-                already_included = any(
-                    os.path.commonpath([p, abs_path]) == p
-                    for path_list in paths_to_move.values()
-                    for p in path_list
-                )
-                if already_included:
-                    continue
-                for move_rule in move_rules:
-                    if re.fullmatch(
-                        move_rule["src_regex"], os.path.relpath(abs_path, extract_dir)
-                    ):
-                        paths_to_move[move_rule["dst"]].append(abs_path)
-                        paths_to_move_rule[abs_path] = move_rule
-                        break
-
+                rel_path = item if rel_root == os.curdir else os.path.join(rel_root, item)
+                move_rule = match_move_rule(rel_path)
+                if move_rule is not None:
+                    paths_to_move[move_rule["dst"]].append(abs_path)
+                    paths_to_move_rule[abs_path] = move_rule
+                    matched_items.add(item)
+            # Don't descend into matched directories. Their contents move with them.
+            dirs[:] = [d for d in dirs if d not in matched_items]
+
+        # resolve default owner/group once instead of once per file
+        uid, gid = os.getuid(), os.getgid()
         for p, move_rule in paths_to_move_rule.items():
             set_mode_owner_group(
                 module,
                 p,
                 move_rule.get("mode"),
-                move_rule.get("owner"),
-                move_rule.get("group"),
+                move_rule.get("owner") or uid,
+                move_rule.get("group") or gid,
             )
 
         return move_paths(module, paths_to_move)
@@ -323,20 +676,15 @@ class AssetSelector:
     asset_regex: re.Pattern
     system: str
     architectures: List[str]
+    architecture_regex: re.Pattern
 
     class AssetSelectionFailed(Exception):
         pass
 
     def __init__(self,  asset_regex: re.Pattern, asset_arch_mapping: dict):
         self.asset_regex = asset_regex
-        self.system = platform.system().lower()  # linux, darwin, windows, ...
-        machine = platform.machine().lower()
-        architectures: List[str] = {
-            "x86_64": ["x86_64", "amd64"],
-            "amd64": ["x86_64", "amd64"],
-            "aarch64": ["aarch64", "arm64"],
-            "arm64": ["aarch64", "arm64"],
-        }.get(machine, [machine])
+        self.system = SYSTEM
+        architectures: List[str] = ARCHITECTURE_ALIASES.get(MACHINE, [MACHINE])
         try:
             arch_mapping_key = list(set(architectures).intersection(asset_arch_mapping.keys()))[0]
         except IndexError:
@@ -344,50 +692,60 @@ class AssetSelector:
         else:
             self.architectures = (
                 asset_arch_mapping[arch_mapping_key]
-                if type(asset_arch_mapping[arch_mapping_key]) == list
+                if isinstance(asset_arch_mapping[arch_mapping_key], list)
                 else [asset_arch_mapping[arch_mapping_key]]
             )
+        self.architecture_regex = re.compile(
+            rf"(?:^|\W|_)(?:{'|'.join(re.escape(a) for a in self.architectures)})(?:$|\W|_)"
+        )
 
     def asset_matches_system(self, asset: dict) -> bool:
-        return self.system in asset["name"].lower()
+        return self.system in asset["_lc_name"]
 
     def asset_matches_architecture(self, asset: dict) -> bool:
-        return any(
-            re.search(rf"(?:^|\W|_){re.escape(architecture)}(?:$|\W|_)", asset["name"].lower())
-            for architecture in self.architectures
-        )
+        return bool(self.architecture_regex.search(asset["_lc_name"]))
 
     def select_asset(
         self,
         assets: List[dict]
     ) -> dict:
-        filtered_assets = [asset for asset in assets if self.asset_regex.fullmatch(asset["name"])]
-        if len(filtered_assets) == 0:
+        # Classify all assets in a single pass. Architecture and system are only
+        # checked for assets that passed the previous filters.
+        regex_matched, arch_matched, system_matched = [], [], []
+        for asset in assets:
+            if not self.asset_regex.fullmatch(asset["name"]):
+                continue
+            regex_matched.append(asset)
+            asset["_lc_name"] = asset["name"].lower()
+            if self.asset_matches_architecture(asset):
+                arch_matched.append(asset)
+                if self.asset_matches_system(asset):
+                    system_matched.append(asset)
+
+        if len(regex_matched) == 0:
             raise self.AssetSelectionFailed('No asset matched "asset_regex".')
-        if len(filtered_assets) == 1:
-            return filtered_assets[0]
+        if len(regex_matched) == 1:
+            return regex_matched[0]
 
         # try filtering assets based on architecture
-        filtered_assets = [asset for asset in filtered_assets if self.asset_matches_architecture(asset)]
-        if len(filtered_assets) == 0:
+        if len(arch_matched) == 0:
             raise self.AssetSelectionFailed(
                 'More than one asset matched "asset_regex". '
                 f'Tried to filter them based on architecture ({",".join(self.architectures)}), but no asset matched.'
             )
-        if len(filtered_assets) == 1:
-            return filtered_assets[0]
+        if len(arch_matched) == 1:
+            return arch_matched[0]
 
         # try filtering assets based on system
-        filtered_assets = [asset for asset in filtered_assets if self.asset_matches_system(asset)]
-        if len(filtered_assets) == 0:
+        if len(system_matched) == 0:
             raise self.AssetSelectionFailed(
                 f'More than one asset matched "asset_regex" and architecture ({",".join(self.architectures)}). '
                 f'Tried to filter them based on system ({self.system}), but no asset matched.'
             )
-        if len(filtered_assets) == 1:
-            return filtered_assets[0]
+        if len(system_matched) == 1:
+            return system_matched[0]
 
-        raise self.AssetSelectionFailed(f"Couldn't select a unique asset. Assets matched: {len(filtered_assets)}")
+        raise self.AssetSelectionFailed(f"Couldn't select a unique asset. Assets matched: {len(system_matched)}")
 
 
 def main():
@@ -407,6 +765,13 @@ def main():
             "version_file": {"required": False, "type": "path"},
             # 5. after download, move files/dirs to destinations
             "move_rules": {"required": True, "type": "list", "elements": "dict"},
+            # authenticated requests have a higher rate limit
+            "github_token": {
+                "required": False,
+                "type": "str",
+                "no_log": True,
+                "fallback": (env_fallback, ["GITHUB_TOKEN"]),
+            },
         },
         supports_check_mode=False,
         mutually_exclusive=(
@@ -421,33 +786,42 @@ def main():
     asset_regex: re.Pattern = re.compile(module.params["asset_regex"])
     asset_arch_mapping: dict = module.params["asset_arch_mapping"]
     version_command: str = module.params["version_command"]
-    version_regex = module.params["version_regex"] or r"\d+\.\d+(?:\.\d+)?"
+    version_regex: re.Pattern = (
+        re.compile(module.params["version_regex"]) if module.params["version_regex"] else DEFAULT_VERSION_REGEX
+    )
     version_file = module.params["version_file"]
     move_rules: List[dict] = module.params["move_rules"]
+    github_token: str = module.params["github_token"]
 
-    if not re.match(r"[\w\-_]+/[\w\-_]+", repo):
+    if not REPO_REGEX.match(repo):
         module.fail_json(msg="Invalid repo")
 
     move_rule_schema = {
-        "src_regex": {"allowed_types": [str], "required": True},
-        "dst": {"allowed_types": [str], "required": True},
-        "mode": {"allowed_types": [str, int], "required": False},
-        "owner": {"allowed_types": [str], "required": False},
-        "group": {"allowed_types": [str], "required": False},
+        "src_regex": {"allowed_types": (str,), "required": True},
+        "dst": {"allowed_types": (str,), "required": True},
+        "mode": {"allowed_types": (str, int), "required": False},
+        "owner": {"allowed_types": (str, int), "required": False},
+        "group": {"allowed_types": (str, int), "required": False},
     }
+    # Compiled src_regex of each rule, reused by download_asset for every extracted path.
+    # (Kept out of the rules themselves: module params must stay JSON-serializable.)
+    src_patterns: List[re.Pattern] = []
     for move_rule in move_rules:
         for k, schema in move_rule_schema.items():
-            if schema.get("required") and k not in move_rule:
-                module.fail_json(
-                    msg=f"Some move rule does not have required argument '{k}'."
-                )
-            if k in move_rules and not any(
-                isinstance(move_rule[k], allowed_type)
-                for allowed_type in schema.get("allowed_types", [object])
-            ):
+            # null (e.g. a templated `default(None)`) means the argument is not set
+            if move_rule.get(k) is None:
+                if schema.get("required"):
+                    module.fail_json(
+                        msg=f"Some move rule does not have required argument '{k}'."
+                    )
+            elif not isinstance(move_rule[k], schema.get("allowed_types", object)):
                 module.fail_json(
                     msg=f"Some move rule has invalid type for argument '{k}'."
                 )
+        try:
+            src_patterns.append(re.compile(move_rule["src_regex"]))
+        except re.error as e:
+            module.fail_json(msg=f"Some move rule has invalid 'src_regex': {e}")
         move_rule["dst"] = os.path.expanduser(move_rule["dst"])
 
     if tag == "latest":
@@ -457,7 +831,7 @@ def main():
         # https://docs.github.com/en/rest/releases/releases#get-a-release-by-tag-name
         release_info_url = f"/repos/{repo}/releases/tags/{tag}"
 
-    release_info = get_json_url(f"https://api.github.com{release_info_url}")
+    release_info = get_json_url(f"https://api.github.com{release_info_url}", github_token)
 
     if not is_download_required(
         module, version_command, version_regex, version_file, release_info
@@ -471,7 +845,7 @@ def main():
         return
 
     changed = download_asset(
-        module, asset["name"], asset["browser_download_url"], move_rules
+        module, asset["name"], asset["browser_download_url"], move_rules, src_patterns
     )
 
     if version_file:
@@ -1,35 +1,49 @@
-import os
+import ast
 import pathlib
-import subprocess
-import json
+import yaml
 from jinja2 import Template
 from pytablewriter import MarkdownTableWriter
 
 
+def read_module_meta(module_path: pathlib.Path) -> dict:
+    """
+    Read DOCUMENTATION and EXAMPLES from the module source, without importing it
+    (which would require ansible) or spawning ansible-doc.
+    """
+    constants = {
+        target.id: ast.literal_eval(node.value)
+        for node in ast.parse(module_path.read_text()).body
+        if isinstance(node, ast.Assign)
+        for target in node.targets
+        if isinstance(target, ast.Name) and target.id in ("DOCUMENTATION", "EXAMPLES")
+    }
+    return {
+        "doc": yaml.safe_load(constants["DOCUMENTATION"]),
+        "examples": constants["EXAMPLES"],
+    }
+
+
 def main():
     collection_path = pathlib.Path(__file__).parent.parent.resolve()
-    os.environ["ANSIBLE_LIBRARY"] = str(collection_path / "plugins/modules")
-    module_meta = json.loads(
-        subprocess.check_output(
-            ["ansible-doc", "-t", "module", "--json", "install_from_github"], text=True
-        )
-    ).get("install_from_github")
+    module_meta = read_module_meta(collection_path / "plugins/modules/install_from_github.py")
 
+    type_template = Template(
+        """
+Type: `{{ type }}`
+{% if required %}<br/>**Required**{% endif %}
+{% if default %}<br/>Default: `{{ default }}`{% endif %}"""
+    )
     writer = MarkdownTableWriter(
         # table_name="module options",
         headers=["Parameter", "Type", "Description"],
         value_matrix=[
             [
                 k,
-                Template(
-                    """
-Type: `{{ type }}`
-{% if required %}<br/>**Required**{% endif %}
-{% if default %}<br/>Default: `{{ default }}`{% endif %}"""
-                ).render(key=k, **v),
+                type_template.render(key=k, **v),
                 "<br/>".join(v["description"]),
             ]
-            for k, v in module_meta["doc"]["options"].items()
+            # sorted like ansible-doc's output
+            for k, v in sorted(module_meta["doc"]["options"].items())
         ],
     )
     options_md_table = writer.dumps()